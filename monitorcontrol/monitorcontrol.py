@@ -1,12 +1,23 @@
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Type, Union
 import enum
 
-from .vcp import VCP
-from .vcp.vcp_codes import get_vcp_com
+from . import vcp as _vcp
+from .vcp.vcp_abc import VCP
+from .vcp.vcp_codes import get_vcp_com_by_name
 
 
+def _format_as_str(member: enum.Enum, format_spec: str) -> str:
+    return format(str(member), format_spec)
+
+
+# IntEnum str() and format() return the value on python 3.11+ and format()
+# returns it on earlier versions, the enums keep the Enum output instead
 @enum.unique
-class ColorPreset(enum.Enum):
+class ColorPreset(enum.IntEnum):
+    __str__ = enum.Enum.__str__
+    __format__ = _format_as_str
+
     COLOR_TEMP_4000K = 0x03
     COLOR_TEMP_5000K = 0x04
     COLOR_TEMP_6500K = 0x05
@@ -21,7 +32,10 @@ class ColorPreset(enum.Enum):
 
 
 @enum.unique
-class PowerMode(enum.Enum):
+class PowerMode(enum.IntEnum):
+    __str__ = enum.Enum.__str__
+    __format__ = _format_as_str
+
     on = 0x01
     standby = 0x02
     suspend = 0x03
@@ -30,7 +44,10 @@ class PowerMode(enum.Enum):
 
 
 @enum.unique
-class InputSource(enum.Enum):
+class InputSource(enum.IntEnum):
+    __str__ = enum.Enum.__str__
+    __format__ = _format_as_str
+
     OFF = 0x00
     ANALOG1 = 0x01
     ANALOG2 = 0x02
@@ -52,6 +69,60 @@ class InputSource(enum.Enum):
     HDMI2 = 0x12
 
 
+_LUMINANCE = get_vcp_com_by_name("image_luminance")
+_CONTRAST = get_vcp_com_by_name("image_contrast")
+_COLOR_PRESET = get_vcp_com_by_name("image_color_preset")
+_POWER_MODE = get_vcp_com_by_name("display_power_mode")
+_INPUT_SELECT = get_vcp_com_by_name("input_select")
+_LUMINANCE_OPCODE = _LUMINANCE.value
+
+_INPUT_BY_VALUE = {member.value: member for member in InputSource}
+
+# input sources by upper and lower case name, mixed case falls back to upper()
+_INPUT_BY_NAME = {
+    **InputSource.__members__,
+    **{name.lower(): member for name, member in InputSource.__members__.items()},
+}
+
+
+def _input_source_from_name(name: str) -> InputSource:
+    try:
+        return _INPUT_BY_NAME[name]
+    except KeyError:
+        return InputSource[name.upper()]
+
+
+def _enum_coercions(enum_cls: Type[enum.IntEnum]) -> Dict[type, Callable]:
+    """Maps the accepted setter argument types to enum member coercions."""
+    return {
+        str: enum_cls.__getitem__,
+        int: enum_cls,
+        enum_cls: lambda v: v,
+    }
+
+
+def _coerce(coercions: Dict[type, Callable], value, message: str) -> int:
+    coerce = coercions.get(type(value))
+    if coerce is None:
+        # subclasses such as bool or members of another IntEnum
+        for value_type, coerce in coercions.items():
+            if isinstance(value, value_type):
+                break
+        else:
+            raise TypeError(message + repr(type(value)))
+    return coerce(value)
+
+
+_COLOR_PRESET_COERCE = _enum_coercions(ColorPreset)
+_POWER_MODE_COERCE = _enum_coercions(PowerMode)
+_INPUT_SOURCE_COERCE = {
+    **_enum_coercions(InputSource),
+    # input sources outside of the MCCS specification are allowed
+    int: lambda v: v,
+    str: _input_source_from_name,
+}
+
+
 class InputSourceValueError(ValueError):
     def __init__(self, message: str, value: int):
         super().__init__(message)
@@ -59,84 +130,71 @@ class InputSourceValueError(ValueError):
 
 
 def get_luminance(vcp: VCP) -> int:
-    code = get_vcp_com("image_luminance")
-    return vcp.get_vcp_feature(code)[0]
+    return vcp.get_vcp_feature(_LUMINANCE)[0]
 
 
 def set_luminance(vcp: VCP, value: int):
-    code = get_vcp_com("image_luminance")
-    vcp.set_vcp_feature(code, value)
+    vcp.set_vcp_feature(_LUMINANCE, value)
+
+
+def set_luminance_fast(vcp: VCP, value: int):
+    """
+    Sets the luminance without validating the value.
+
+    Skips the checks done by :py:func:`set_luminance`, for callers such as a
+    brightness slider that set values already known to be in range many
+    times per second.
+
+    Args:
+        vcp: VCP, must be inside its context.
+        value: Luminance, at most the maximum luminance of the monitor.
+
+    Raises:
+        RuntimeError: Called outside of the context manager.
+    """
+    if not vcp._in_ctx:
+        raise RuntimeError("This function must be run within the context manager")
+    vcp._set_vcp_raw(_LUMINANCE_OPCODE, value)
 
 
 def get_color_preset(vcp: VCP) -> int:
-    code = get_vcp_com("image_color_preset")
-    return vcp.get_vcp_feature(code)[0]
+    return vcp.get_vcp_feature(_COLOR_PRESET)[0]
 
 
 def set_color_preset(vcp: VCP, value: Union[int, str, ColorPreset]):
-    if isinstance(value, str):
-        mode_value = getattr(ColorPreset, value).value
-    elif isinstance(value, int):
-        mode_value = ColorPreset(value).value
-    elif isinstance(value, ColorPreset):
-        mode_value = value.value
-    else:
-        raise TypeError("unsupported color preset: " + repr(type(value)))
-
-    code = get_vcp_com("image_color_preset")
-    vcp.set_vcp_feature(code, mode_value)
+    mode_value = _coerce(_COLOR_PRESET_COERCE, value, "unsupported color preset: ")
+    vcp.set_vcp_feature(_COLOR_PRESET, mode_value)
 
 
 def get_contrast(vcp: VCP) -> int:
-    code = get_vcp_com("image_contrast")
-    return vcp.get_vcp_feature(code)[0]
+    return vcp.get_vcp_feature(_CONTRAST)[0]
 
 
 def set_contrast(vcp: VCP, value: int):
-    code = get_vcp_com("image_contrast")
-    vcp.set_vcp_feature(code, value)
+    vcp.set_vcp_feature(_CONTRAST, value)
 
 
 def get_power_mode(vcp: VCP) -> PowerMode:
-    code = get_vcp_com("display_power_mode")
-    return PowerMode(vcp.get_vcp_feature(code)[0])
+    return PowerMode(vcp.get_vcp_feature(_POWER_MODE)[0])
 
 
 def set_power_mode(vcp: VCP, value: Union[int, str, PowerMode]):
-    if isinstance(value, str):
-        mode_value = getattr(PowerMode, value).value
-    elif isinstance(value, int):
-        mode_value = PowerMode(value).value
-    elif isinstance(value, PowerMode):
-        mode_value = value.value
-    else:
-        raise TypeError("unsupported mode type: " + repr(type(value)))
-
-    code = get_vcp_com("display_power_mode")
-    vcp.set_vcp_feature(code, mode_value)
+    mode_value = _coerce(_POWER_MODE_COERCE, value, "unsupported mode type: ")
+    vcp.set_vcp_feature(_POWER_MODE, mode_value)
 
 
 def get_input_source(vcp: VCP) -> InputSource:
-    code = get_vcp_com("input_select")
-    value = vcp.get_vcp_feature(code)[0] & 0xFF
-    try:
-        return InputSource(value)
-    except ValueError:
+    # the input source is the low byte, some monitors set the reserved high byte
+    value = vcp.get_vcp_feature(_INPUT_SELECT)[0] & 0xFF
+    input_source = _INPUT_BY_VALUE.get(value)
+    if input_source is None:
         raise InputSourceValueError(f"{value} is not a valid InputSource", value)
+    return input_source
 
 
 def set_input_source(vcp: VCP, value: Union[int, str, InputSource]):
-    if isinstance(value, str):
-        mode_value = getattr(InputSource, value.upper()).value
-    elif isinstance(value, int):
-        mode_value = value
-    elif isinstance(value, InputSource):
-        mode_value = value.value
-    else:
-        raise TypeError("unsupported input type: " + repr(type(value)))
-
-    code = get_vcp_com("input_select")
-    vcp.set_vcp_feature(code, mode_value)
+    mode_value = _coerce(_INPUT_SOURCE_COERCE, value, "unsupported input type: ")
+    vcp.set_vcp_feature(_INPUT_SELECT, mode_value)
 
 
 def get_capabilities(vcp: VCP) -> dict:
@@ -144,4 +202,46 @@ def get_capabilities(vcp: VCP) -> dict:
 
 
 def get_vcps() -> List[VCP]:
-    return VCP.get_vcps()
+    return _vcp.get_vcps()
+
+
+def broadcast(vcps: List[VCP], fn: Callable[..., Any], *args) -> List[Any]:
+    """
+    Calls ``fn(vcp, *args)`` on every VCP concurrently.
+
+    Each VCP is entered as a context manager for the duration of the call.
+    VCPs sit on independent busses, so the mandatory DDC-CI delays of each
+    monitor overlap instead of accumulating.
+
+    Each call runs in the context of its own VCP, an error on one monitor is
+    handled by that VCP only and does not close the handles or clear the
+    cached capabilities of the others.
+
+    Args:
+        vcps: VCPs to operate on.
+        fn: Function to call, e.g. :py:func:`set_luminance`.
+        *args: Additional arguments passed to ``fn``.
+
+    Returns:
+        Return values of ``fn`` in the same order as ``vcps``.
+
+    Raises:
+        Exception: The first exception raised by ``fn``, in ``vcps`` order.
+            Exceptions raised by ``fn`` for the other VCPs are discarded.
+
+    Example:
+        Set the luminance of all monitors to 50::
+
+            broadcast(get_vcps(), set_luminance, 50)
+    """
+    if not vcps:
+        return []
+
+    def call(vcp: VCP):
+        with vcp:
+            return fn(vcp, *args)
+
+    # leaving the executor waits for every call to finish
+    with ThreadPoolExecutor(max_workers=len(vcps)) as executor:
+        futures = [executor.submit(call, vcp) for vcp in vcps]
+    return [future.result() for future in futures]
@@ -1,14 +1,43 @@
+import importlib
 import sys
+from typing import List, Type
 from .vcp_codes import VPCCommand  # noqa: F401
 from .vcp_abc import (  # noqa: F401
     VCPError,
     VCPIOError,
     VCPPermissionError,
 )
+from . import vcp_abc
 
+# the OS backend is imported on first use, this keeps ctypes and pyudev out of
+# the import time of short lived CLI invocations
 if sys.platform == "win32":
-    from .vcp_windows import WindowsVCP as VCP  # noqa: F401
+    _BACKEND = (".vcp_windows", "WindowsVCP")
 elif sys.platform.startswith("linux"):
-    from .vcp_linux import LinuxVCP as VCP  # noqa: F401
+    _BACKEND = (".vcp_linux", "LinuxVCP")
 else:
-    raise NotImplementedError(f"Your OS is not supported. Supported OSs are: Windows, Linux. Detected system: {sys.platform}")
+    raise NotImplementedError(
+        "Your OS is not supported. Supported OSs are: Windows, Linux. "
+        f"Detected system: {sys.platform}"
+    )
+
+
+def _backend() -> Type[vcp_abc.VCP]:
+    module_name, class_name = _BACKEND
+    return getattr(importlib.import_module(module_name, __name__), class_name)
+
+
+def get_vcps() -> List[vcp_abc.VCP]:
+    """
+    Gets all VCPs using the backend for the current OS.
+
+    Returns:
+        List of all VCPs detected.
+    """
+    return _backend().get_vcps()
+
+
+def __getattr__(name: str):
+    if name == "VCP":
+        return _backend()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,9 @@
 from __future__ import annotations
-import abc
 import logging
+import weakref
+from array import array
 from types import TracebackType
-from typing import Optional, Tuple, Type, List
+from typing import Callable, Dict, Iterable, Optional, Tuple, Type, List
 
 from .vcp_codes import VPCCommand
 
@@ -25,30 +26,78 @@ class VCPPermissionError(VCPError):
     pass
 
 
-class VCP(abc.ABC):
+class VCP:
+    """
+    Base class of the OS specific virtual control panel backends.
+    """
+
+    __slots__ = (
+        "logger",
+        "code_maximum",
+        "_max_cached",
+        "_in_ctx",
+        "_cached_caps",
+        "_finalizer",
+        "__weakref__",
+    )
 
-    @abc.abstractmethod
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.code_maximum = {}
-        self._in_ctx = False
+        # 16 bit maximum value of each VCP opcode, only valid once the bit of
+        # the opcode is set in _max_cached
+        self.code_maximum = array("H", bytes(512))
+        self._max_cached = bytearray(32)
+        # context nesting depth, contexts can be re-entered
+        self._in_ctx = 0
+        self._cached_caps: Optional[dict] = None
+        self._finalizer: Optional[weakref.finalize] = None
 
-    @abc.abstractmethod
     def __enter__(self):
-        self._in_ctx = True
+        # the handle is kept open between contexts to skip the slow probe
+        if self._finalizer is None or not self._finalizer.alive:
+            self._finalizer = weakref.finalize(self, self._open())
+        self._in_ctx += 1
         return self
 
-    @abc.abstractmethod
     def __exit__(
         self,
         exception_type: Optional[Type[BaseException]],
         exception_value: Optional[BaseException],
         exception_traceback: Optional[TracebackType],
     ) -> Optional[bool]:
-        self._in_ctx = False
+        self._in_ctx -= 1
+        if exception_type is not None and issubclass(exception_type, VCPError):
+            # the monitor may have been disconnected or replaced
+            self._cached_caps = None
+            if not self._in_ctx:
+                self.close()
         return False
 
-    @abc.abstractmethod
+    def _open(self) -> Callable[[], None]:
+        """
+        Opens the OS handle to the virtual control panel.
+
+        Returns:
+            Function closing the handle, it must not reference the VCP.
+
+        Raises:
+            VCPError: Failed to open the handle.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Closes the OS handle to the virtual control panel.
+
+        The handle stays open between contexts until this is called or the
+        VCP is garbage collected.
+
+        Raises:
+            VCPError: Failed to close the handle.
+        """
+        if self._finalizer is not None:
+            self._finalizer()
+
     def set_vcp_feature(self, code: VPCCommand, value: int):
         """
         Sets the value of a feature on the virtual control panel.
@@ -60,9 +109,21 @@ class VCP(abc.ABC):
         Raises:
             VCPError: Failed to set VCP feature.
         """
-        pass
+        raise NotImplementedError
+
+    def _set_vcp_raw(self, opcode: int, value: int):
+        """
+        Sets the value of a feature without checking the code or the value.
+
+        Args:
+            opcode: Feature opcode.
+            value: Feature value.
+
+        Raises:
+            VCPError: Failed to set VCP feature.
+        """
+        raise NotImplementedError
 
-    @abc.abstractmethod
     def get_vcp_feature(self, code: VPCCommand) -> Tuple[int, int]:
         """
         Gets the value of a feature from the virtual control panel.
@@ -72,20 +133,55 @@ class VCP(abc.ABC):
 
         Returns:
             Current feature value, maximum feature value.
+            Both are the full 16 bit values (high and low byte) as reported
+            by the monitor, the high byte is not masked off.
+
+        Raises:
+            VCPError: Failed to get VCP feature.
+        """
+        raise NotImplementedError
+
+    def get_vcp_features(
+        self, codes: Iterable[VPCCommand]
+    ) -> Dict[VPCCommand, Tuple[int, int]]:
+        """
+        Gets the values of multiple features from the virtual control panel.
+
+        Args:
+            codes: Feature codes.
+
+        Returns:
+            Current feature value, maximum feature value by feature code.
 
         Raises:
             VCPError: Failed to get VCP feature.
         """
-        pass
+        return {code: self.get_vcp_feature(code) for code in codes}
 
-    @abc.abstractmethod
     def get_vcp_capabilities(self) -> dict:
-        pass
+        """
+        Gets the capabilities of the virtual control panel.
+
+        The capabilities are read from the monitor once and cached, they are
+        read again only after a context exits with a :py:class:`VCPError`.
+
+        Returns:
+            Parsed capabilities.
+
+        Raises:
+            VCPError: Failed to get VCP capabilities.
+        """
+        if self._cached_caps is None:
+            self._cached_caps = self._read_capabilities()
+        return self._cached_caps
+
+    def _read_capabilities(self) -> dict:
+        raise NotImplementedError
 
     def _get_code_maximum(self, code: VPCCommand) -> int:
         """
         Gets the maximum values for a given code, and caches in the
-        class dictionary if not already found.
+        table indexed by opcode if not already found.
 
         Args:
             code: Feature code definition class.
@@ -94,20 +190,41 @@ class VCP(abc.ABC):
             Maximum value for the given code.
 
         Raises:
+            RuntimeError: Called outside of the context manager.
             TypeError: Code is write only.
         """
-        assert self._in_ctx, "This function must be run within the context manager"
+        if not self._in_ctx:
+            raise RuntimeError("This function must be run within the context manager")
         if not code.readable:
             raise TypeError(f"code is not readable: {code.name}")
 
-        if code.value in self.code_maximum:
-            return self.code_maximum[code.value]
-        else:
-            _, maximum = self.get_vcp_feature(code)
-            self.code_maximum[code.value] = maximum
-            return maximum
+        opcode = code.value
+        if self._max_cached[opcode >> 3] & (1 << (opcode & 7)):
+            return self.code_maximum[opcode]
+        _, maximum = self.get_vcp_feature(code)
+        self.code_maximum[opcode] = maximum
+        self._max_cached[opcode >> 3] |= 1 << (opcode & 7)
+        return maximum
+
+    def prefetch_maxima(self, codes: Iterable[VPCCommand]):
+        """
+        Reads and caches the maximum values of continuous codes up front.
+
+        Setting a continuous code reads its maximum the first time, calling
+        this right after entering the context moves those reads out of the
+        individual set calls.
+
+        Args:
+            codes: Feature codes, codes that are not readable or not
+                continuous are skipped.
+
+        Raises:
+            VCPError: Failed to get VCP feature.
+        """
+        for code in codes:
+            if code.readable and not code.discreet:
+                self._get_code_maximum(code)
 
     @staticmethod
-    @abc.abstractmethod
     def get_vcps() -> List[VCP]:
-        pass
+        raise NotImplementedError
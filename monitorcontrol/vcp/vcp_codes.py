@@ -1,31 +1,56 @@
+import sys
 from dataclasses import dataclass
-from enum import Enum, unique
-from typing import Union
+from enum import IntFlag, unique
+from typing import Iterable, Union
 
 
 @unique
-class ComType(Enum):
-    ro = "ro"
-    wo = "wo"
-    rw = "rw"
+class ComType(IntFlag):
+    # bit 0 is readable, bit 1 is writeable
+    ro = 0b01
+    wo = 0b10
+    rw = 0b11
 
 
-@dataclass(frozen=True)
+# commands are unique per name and value in the registry below, eq=False makes
+# comparison and hashing use identity instead of comparing every field
+@dataclass(frozen=True, eq=False)
 class VPCCommand:
+    # dataclass(slots=True) requires python 3.10
+    __slots__ = (
+        "name",
+        "desc",
+        "value",
+        "type",
+        "discreet",
+        "readable",
+        "writeable",
+    )
+
     name: str
     desc: str
     value: int
     type: ComType
     discreet: bool
 
-    def readable(self) -> bool:
-        return 'r' in self.type.value
+    def __post_init__(self):
+        # names built at runtime are interned like the literal names below
+        object.__setattr__(self, "name", sys.intern(self.name))
+        # fixed per command, computed once instead of on every feature access
+        object.__setattr__(self, "readable", bool(self.type & ComType.ro))
+        object.__setattr__(self, "writeable", bool(self.type & ComType.wo))
 
-    def writeable(self) -> bool:
-        return 'w' in self.type.value
+    # copies of a registered command resolve to the registered command, as
+    # equality is identity, other commands are rebuilt from their fields since
+    # the default copy and pickle state is restored with the frozen setattr
+    def __reduce__(self):
+        if _BY_NAME.get(self.name) is self:
+            return get_vcp_com_by_name, (self.name,)
+        return type(self), (self.name, self.desc, self.value, self.type, self.discreet)
 
 
-__VCP_COMMANDS = [
+# commands defined by the MCCS specification, user commands only go in the indexes
+_BASE_COMMANDS = (
     VPCCommand(
         name="image_factory_default",
         desc="restore factory default image",
@@ -74,144 +99,57 @@ __VCP_COMMANDS = [
         value=0xD6,
         type=ComType.rw,
         discreet=True),
-]
+)
+
+
+# indexes of the commands by name and by value
+_BY_NAME = {com.name: com for com in _BASE_COMMANDS}
+_BY_VALUE = {com.value: com for com in _BASE_COMMANDS}
+
+
+def get_vcp_com_by_name(name: str) -> VPCCommand:
+    try:
+        return _BY_NAME[name]
+    except KeyError:
+        raise LookupError(f"No VCP code matched key: {name}") from None
+
+
+def get_vcp_com_by_value(value: int) -> VPCCommand:
+    try:
+        return _BY_VALUE[value]
+    except KeyError:
+        raise LookupError(f"No VCP code matched key: {value}") from None
+
+
+_LOOKUP_BY_KEY_TYPE = {str: get_vcp_com_by_name, int: get_vcp_com_by_value}
 
 
 def get_vcp_com(key: Union[str, int]) -> VPCCommand:
-    if not (isinstance(key, str) or isinstance(key, int)):
-        raise TypeError(f"key must be string or int. Got {type(key)}.")
-    for com in __VCP_COMMANDS:
-        if isinstance(key, str) and com.name == key:
-            return com
-        elif com.value == key:
-            return com
-    raise LookupError(f"No VCP code matched key: {key}")
+    lookup = _LOOKUP_BY_KEY_TYPE.get(type(key))
+    if lookup is None:
+        # subclasses such as IntEnum members
+        if isinstance(key, str):
+            lookup = get_vcp_com_by_name
+        elif isinstance(key, int):
+            lookup = get_vcp_com_by_value
+        else:
+            raise TypeError(f"key must be string or int. Got {type(key)}.")
+    return lookup(key)
 
 
 def add_vcp_com(newcom: VPCCommand):
-    for com in __VCP_COMMANDS:
-        if newcom.name == com.name:
-            raise ValueError(f"VCP code with name {newcom.name} already exists")
-        if newcom.value == com.value:
-            raise ValueError(f"VCP code with value {newcom.value} already exists")
-
-    __VCP_COMMANDS.append(newcom)
-
-
-#
-# # f strings require python 3.6
-# assert sys.version_info >= (3, 6), "f strings require python 3.6"
-# # incomplete list of VCP codes from the MCCS specification
-# _VCP_CODE_DEFINTIONS = {
-#     "image_factory_default": {
-#         "name": "restore factory default image",
-#         "value": 0x04,
-#         "type": "wo",
-#         "function": "nc",
-#     },
-#     "image_luminance": {
-#         "name": "image luminance",
-#         "value": 0x10,
-#         "type": "rw",
-#         "function": "c",
-#     },
-#     "image_contrast": {
-#         "name": "image contrast",
-#         "value": 0x12,
-#         "type": "rw",
-#         "function": "c",
-#     },
-#     "image_color_preset": {
-#         "name": "image color preset",
-#         "value": 0x14,
-#         "type": "rw",
-#         "function": "nc",
-#     },
-#     "active_control": {
-#         "name": "active control",
-#         "value": 0x52,
-#         "type": "ro",
-#         "function": "nc",
-#     },
-#     "input_select": {
-#         "name": "input select",
-#         "value": 0x60,
-#         "type": "rw",
-#         "function": "nc",
-#     },
-#     "image_orientation": {
-#         "name": "image orientation",
-#         "value": 0xAA,
-#         "type": "ro",
-#         "function": "nc",
-#     },
-#     "display_power_mode": {
-#         "name": "display power mode",
-#         "value": 0xD6,
-#         "type": "rw",
-#         "function": "nc",
-#     },
-# }
-#
-#
-# class VCPCode:
-#     """
-#     Virtual Control Panel code.  Simple container for the control
-#     codes defined by the VESA Monitor Control Command Set (MCCS).
-#
-#     This should be used by getting the code from
-#     :py:meth:`get_vcp_code_definition()`
-#
-#     Args:
-#         name: VCP code name.
-#
-#     Raises:
-#         KeyError: VCP code not found.
-#     """
-#
-#     def __init__(self, name: str):
-#         self.definition = _VCP_CODE_DEFINTIONS[name]
-#
-#     def __repr__(self) -> str:
-#         return (
-#             "virtual control panel code definition. "
-#             f"value: {self.value} "
-#             f"type: {self.type}"
-#             f"function: {self.function}"
-#         )
-#
-#     @property
-#     def name(self) -> int:
-#         """Friendly name of the code."""
-#         return self.definition["name"]
-#
-#     @property
-#     def value(self) -> int:
-#         """Value of the code."""
-#         return self.definition["value"]
-#
-#     @property
-#     def type(self) -> str:
-#         """Type of the code."""
-#         return self.definition["type"]
-#
-#     @property
-#     def function(self) -> str:
-#         """Function of the code."""
-#         return self.definition["function"]
-#
-#     @property
-#     def readable(self) -> bool:
-#         """Returns true if the code can be read."""
-#         if self.type == "wo":
-#             return False
-#         else:
-#             return True
-#
-#     @property
-#     def writeable(self) -> bool:
-#         """Returns true if the code can be written."""
-#         if self.type == "ro":
-#             return False
-#         else:
-#             return True
+    # VCP opcodes are a single byte, VCP.code_maximum has an entry per opcode
+    if not 0 <= newcom.value <= 0xFF:
+        raise ValueError(f"VCP code value {newcom.value} is not in 0x00-0xFF")
+    if newcom.name in _BY_NAME:
+        raise ValueError(f"VCP code with name {newcom.name} already exists")
+    if newcom.value in _BY_VALUE:
+        raise ValueError(f"VCP code with value {newcom.value} already exists")
+
+    _BY_NAME[newcom.name] = newcom
+    _BY_VALUE[newcom.value] = newcom
+
+
+def iter_vcp_coms() -> Iterable[VPCCommand]:
+    """Read-only live view of all VCP commands, including added commands."""
+    return _BY_NAME.values()
@@ -1,8 +1,8 @@
 from __future__ import annotations
 from .vcp_codes import VPCCommand
 from .vcp_abc import VCP, VCPIOError, VCPPermissionError
-from types import TracebackType
-from typing import List, Optional, Tuple, Type
+from typing import Callable, List, Optional, Tuple
+import functools
 import os
 import struct
 import sys
@@ -24,6 +24,8 @@ if sys.platform.startswith("linux"):
             https://github.com/siemer/ddcci/
         """
 
+        __slots__ = ("bus_number", "fd", "fp", "last_set")
+
         GET_VCP_HEADER_LENGTH = 2  # header packet length
         PROTOCOL_FLAG = 0x80  # protocol flag is bit 7 of the length byte
 
@@ -62,8 +64,7 @@ if sys.platform.startswith("linux"):
             # time of last feature set call
             self.last_set: Optional[float] = None
 
-        def __enter__(self):
-            super().__enter__()
+        def _open(self) -> Callable[[], None]:
             def cleanup(fd: Optional[int]):
                 if fd is not None:
                     try:
@@ -84,21 +85,11 @@ if sys.platform.startswith("linux"):
             except Exception as e:
                 cleanup(self.fd)
                 raise e
-            return self
-
-        def __exit__(
-            self,
-            exception_type: Optional[Type[BaseException]],
-            exception_value: Optional[BaseException],
-            exception_traceback: Optional[TracebackType],
-        ) -> Optional[bool]:
-            try:
-                os.close(self.fd)
-            except OSError as e:
-                raise VCPIOError("unable to close descriptor") from e
-            self.fd = None
+            return functools.partial(_close_fd, self.fd)
 
-            return super().__exit__(exception_type, exception_value, exception_traceback)
+        def close(self):
+            super().close()
+            self.fd = None
 
         def set_vcp_feature(self, code: VPCCommand, value: int):
             """
@@ -113,19 +104,32 @@ if sys.platform.startswith("linux"):
             """
 
             assert self._in_ctx, "This function must be run within the context manager"
-            if not code.writeable():
+            if not code.writeable:
                 raise TypeError(f"cannot write read-only code: {code.name}")
-            elif code.readable() and code.discreet == False:
+            elif code.readable and not code.discreet:
                 maximum = self._get_code_maximum(code)
                 if value > maximum:
                     raise ValueError(f"value of {value} exceeds code maximum of {maximum} for {code.name}")
 
+            self._set_vcp_raw(code.value, value)
+
+        def _set_vcp_raw(self, opcode: int, value: int):
+            """
+            Sets the value of a feature without any validation.
+
+            Args:
+                opcode: feature opcode
+                value: feature value
+
+            Raises:
+                VCPIOError: failed to set VCP feature
+            """
             self.rate_limt()
 
             # transmission data
             data = bytearray()
             data.append(self.SET_VCP_CMD)
-            data.append(code.value)
+            data.append(opcode)
             low_byte, high_byte = struct.pack("H", value)
             data.append(high_byte)
             data.append(low_byte)
@@ -157,7 +161,7 @@ if sys.platform.startswith("linux"):
             """
 
             assert self._in_ctx, "This function must be run within the context manager"
-            if not code.readable():
+            if not code.readable:
                 raise TypeError(f"cannot read write-only code: {code.name}")
 
             self.rate_limt()
@@ -223,7 +227,7 @@ if sys.platform.startswith("linux"):
 
             return feature_current, feature_max
 
-        def get_vcp_capabilities(self) -> dict:
+        def _read_capabilities(self) -> dict:
             """
             Gets capabilities string from the virtual control panel.
 
@@ -405,3 +409,9 @@ if sys.platform.startswith("linux"):
                     vcps.append(vcp)
 
             return vcps
+
+    def _close_fd(fd: int):
+        try:
+            os.close(fd)
+        except OSError as e:
+            raise VCPIOError("unable to close descriptor") from e
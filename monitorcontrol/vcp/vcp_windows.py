@@ -1,13 +1,13 @@
 from __future__ import annotations
 from .vcp_codes import VPCCommand
 from .vcp_abc import VCP, VCPError
-from types import TracebackType
-from typing import List, Optional, Tuple, Type
+from typing import Callable, List, Tuple
 import ctypes
+import functools
 import logging
 import sys
 
-from .vcp_codes import get_vcp_com
+from .vcp_codes import get_vcp_com_by_name
 
 # hide the Windows code from Linux CI coverage
 if sys.platform == "win32":
@@ -35,6 +35,8 @@ if sys.platform == "win32":
             https://stackoverflow.com/questions/16588133/
         """
 
+        __slots__ = ("hmonitor", "handle", "description")
+
         def __init__(self, hmonitor: HMONITOR):
             """
             Args:
@@ -43,8 +45,7 @@ if sys.platform == "win32":
             super().__init__()
             self.hmonitor = hmonitor
 
-        def __enter__(self):
-            super().__enter__()
+        def _open(self) -> Callable[[], None]:
             num_physical = DWORD()
             self.logger.debug("GetNumberOfPhysicalMonitorsFromHMONITOR")
             try:
@@ -82,24 +83,9 @@ if sys.platform == "win32":
                 raise VCPError("failed to open physical monitor handle") from e
             self.handle = physical_monitors[0].handle
             self.description = physical_monitors[0].description
-            return self
-
-        def __exit__(
-            self,
-            exception_type: Optional[Type[BaseException]],
-            exception_value: Optional[BaseException],
-            exception_traceback: Optional[TracebackType],
-        ) -> Optional[bool]:
-            self.logger.debug("DestroyPhysicalMonitor")
-            try:
-                if not ctypes.windll.dxva2.DestroyPhysicalMonitor(self.handle):
-                    raise VCPError(
-                        "Call to DestroyPhysicalMonitor failed: " + ctypes.FormatError()
-                    )
-            except OSError as e:
-                raise VCPError("failed to close handle") from e
-
-            return super().__exit__(exception_type, exception_value, exception_traceback)
+            return functools.partial(
+                _destroy_physical_monitor, self.logger, self.handle
+            )
 
         def set_vcp_feature(self, code: VPCCommand, value: int):
             """
@@ -114,17 +100,30 @@ if sys.platform == "win32":
             """
 
             assert self._in_ctx, "This function must be run within the context manager"
-            if not code.writeable():
+            if not code.writeable:
                 raise TypeError(f"cannot write read-only code: {code.name}")
-            elif code.readable() and code.discreet == False:
+            elif code.readable and not code.discreet:
                 maximum = self._get_code_maximum(code)
                 if value > maximum:
                     raise ValueError(f"value of {value} exceeds code maximum of {maximum} for {code.name}")
 
             self.logger.debug(f"SetVCPFeature(_, {code.name=}, {value=})")
+            self._set_vcp_raw(code.value, value)
+
+        def _set_vcp_raw(self, opcode: int, value: int):
+            """
+            Sets the value of a feature without any validation.
+
+            Args:
+                opcode: Feature opcode.
+                value: Feature value.
+
+            Raises:
+                VCPError: Failed to set VCP feature.
+            """
             try:
                 if not ctypes.windll.dxva2.SetVCPFeature(
-                    HANDLE(self.handle), BYTE(code.value), DWORD(value)
+                    HANDLE(self.handle), BYTE(opcode), DWORD(value)
                 ):
                     raise VCPError("failed to set VCP feature: " + ctypes.FormatError())
             except OSError as e:
@@ -145,7 +144,7 @@ if sys.platform == "win32":
             """
 
             assert self._in_ctx, "This function must be run within the context manager"
-            if not code.readable():
+            if not code.readable:
                 raise TypeError(f"cannot read write-only code: {code.name}")
 
             feature_current = DWORD()
@@ -170,7 +169,7 @@ if sys.platform == "win32":
             )
             return feature_current.value, feature_max.value
 
-        def get_vcp_capabilities(self) -> dict:
+        def _read_capabilities(self) -> dict:
             """
             Gets capabilities string from the virtual control panel
 
@@ -244,6 +243,16 @@ if sys.platform == "win32":
             return vcps
 
 
+    def _destroy_physical_monitor(logger: logging.Logger, handle: HANDLE):
+        logger.debug("DestroyPhysicalMonitor")
+        try:
+            if not ctypes.windll.dxva2.DestroyPhysicalMonitor(handle):
+                raise VCPError(
+                    "Call to DestroyPhysicalMonitor failed: " + ctypes.FormatError()
+                )
+        except OSError as e:
+            raise VCPError("failed to close handle") from e
+
     def _extract_a_cap(caps_str: str, key: str) -> str:
         """
         Splits the capabilities string into individual sets.
@@ -322,6 +331,13 @@ if sys.platform == "win32":
         return result_dict
 
 
+    # capabilities holding VCP code lists, parsed into dicts
+    _VCP_LIST_CAPS = frozenset({"cmds", "vcp"})
+
+    # opcodes of the capabilities whose values are parsed into readable lists
+    _INPUT_SELECT_CAP = get_vcp_com_by_name("input_select").value
+    _COLOR_PRESET_CAP = get_vcp_com_by_name("image_color_preset").value
+
     def _parse_capabilities(caps_str: str) -> dict:
         """
         Converts the capabilities string into a nice dict
@@ -357,16 +373,15 @@ if sys.platform == "win32":
         }
 
         for key in caps_dict:
-            if key in ["cmds", "vcp"]:
+            if key in _VCP_LIST_CAPS:
                 caps_dict[key] = _convert_to_dict(_extract_a_cap(caps_str, key))
             else:
                 caps_dict[key] = _extract_a_cap(caps_str, key)
 
         # Parse the input sources into a text list for readability
-        input_source_cap = get_vcp_com("input_select").value
-        if input_source_cap in caps_dict["vcp"]:
+        if _INPUT_SELECT_CAP in caps_dict["vcp"]:
             caps_dict["inputs"] = []
-            input_val_list = list(caps_dict["vcp"][input_source_cap].keys())
+            input_val_list = list(caps_dict["vcp"][_INPUT_SELECT_CAP].keys())
             input_val_list.sort()
 
             for val in input_val_list:
@@ -375,10 +390,9 @@ if sys.platform == "win32":
                 caps_dict["inputs"].append(input_source)
 
         # Parse the color presets into a text list for readability
-        color_preset_cap = get_vcp_com("image_color_preset").value
-        if color_preset_cap in caps_dict["vcp"]:
+        if _COLOR_PRESET_CAP in caps_dict["vcp"]:
             caps_dict["color_presets"] = []
-            color_val_list = list(caps_dict["vcp"][color_preset_cap])
+            color_val_list = list(caps_dict["vcp"][_COLOR_PRESET_CAP])
             color_val_list.sort()
 
             for val in color_val_list:
@@ -0,0 +1,40 @@
+from typing import Callable, List, Tuple
+
+import pytest
+
+from monitorcontrol.vcp.vcp_abc import VCP, VCPIOError
+from monitorcontrol.vcp.vcp_codes import VPCCommand
+
+
+class FakeVCP(VCP):
+    """VCP backend recording its OS calls instead of talking to a monitor."""
+
+    def __init__(self, value: int = 10, fail: bool = False):
+        super().__init__()
+        self.value = value
+        self.fail = fail
+        self.opened = 0
+        self.closed: List[bool] = []
+        self.reads: List[VPCCommand] = []
+        self.caps_reads = 0
+
+    def _open(self) -> Callable[[], None]:
+        self.opened += 1
+        # the closer must not reference the VCP
+        closed = self.closed
+        return lambda: closed.append(True)
+
+    def get_vcp_feature(self, code: VPCCommand) -> Tuple[int, int]:
+        if self.fail:
+            raise VCPIOError("monitor disconnected")
+        self.reads.append(code)
+        return self.value, 100
+
+    def _read_capabilities(self) -> dict:
+        self.caps_reads += 1
+        return {"vcp": {}}
+
+
+@pytest.fixture
+def fake_vcp() -> Callable[..., FakeVCP]:
+    return FakeVCP
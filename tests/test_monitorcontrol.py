@@ -0,0 +1,57 @@
+import pytest
+
+from monitorcontrol.monitorcontrol import (
+    ColorPreset,
+    InputSource,
+    PowerMode,
+    broadcast,
+    get_luminance,
+    set_luminance_fast,
+)
+from monitorcontrol.vcp.vcp_abc import VCP, VCPIOError
+
+
+@pytest.mark.parametrize(
+    "member, text",
+    [
+        (ColorPreset.COLOR_TEMP_6500K, "ColorPreset.COLOR_TEMP_6500K"),
+        (PowerMode.on, "PowerMode.on"),
+        (InputSource.HDMI1, "InputSource.HDMI1"),
+    ],
+)
+def test_enum_str(member, text):
+    assert str(member) == text
+    assert f"{member}" == text
+    assert member == member.value
+
+
+def test_set_luminance_fast_outside_context():
+    with pytest.raises(RuntimeError):
+        set_luminance_fast(VCP(), 50)
+
+
+def test_broadcast(fake_vcp):
+    vcps = [fake_vcp(value) for value in (30, 10, 20)]
+    assert broadcast(vcps, get_luminance) == [30, 10, 20]
+    assert all(vcp._in_ctx == 0 for vcp in vcps)
+
+
+def test_broadcast_empty():
+    assert broadcast([], get_luminance) == []
+
+
+def test_broadcast_error(fake_vcp):
+    vcps = [fake_vcp(), fake_vcp(fail=True), fake_vcp()]
+    for vcp in vcps:
+        vcp.get_vcp_capabilities()
+
+    with pytest.raises(VCPIOError):
+        broadcast(vcps, get_luminance)
+
+    ok_before, failing, ok_after = vcps
+    assert failing.closed == [True]
+    assert failing._cached_caps is None
+    for vcp in (ok_before, ok_after):
+        assert vcp.closed == []
+        assert vcp._cached_caps is not None
+        assert len(vcp.reads) == 1
@@ -0,0 +1,147 @@
+import gc
+
+import pytest
+
+from monitorcontrol.vcp.vcp_abc import VCPIOError
+from monitorcontrol.vcp.vcp_codes import get_vcp_com
+
+
+def test_reenter_does_not_reopen(fake_vcp):
+    vcp = fake_vcp()
+    with vcp:
+        pass
+    with vcp:
+        pass
+    assert vcp.opened == 1
+    assert vcp.closed == []
+
+
+def test_close(fake_vcp):
+    vcp = fake_vcp()
+    with vcp:
+        pass
+    vcp.close()
+    vcp.close()
+    assert vcp.closed == [True]
+
+    with vcp:
+        pass
+    assert vcp.opened == 2
+
+
+def test_close_on_garbage_collection(fake_vcp):
+    vcp = fake_vcp()
+    with vcp:
+        pass
+    closed = vcp.closed
+    del vcp
+    gc.collect()
+    assert closed == [True]
+
+
+def test_nesting(fake_vcp):
+    vcp = fake_vcp()
+    with vcp:
+        with vcp:
+            assert vcp._in_ctx == 2
+        assert vcp._in_ctx == 1
+    assert vcp._in_ctx == 0
+    assert vcp.opened == 1
+
+
+def test_vcp_error_closes(fake_vcp):
+    vcp = fake_vcp()
+    with vcp:
+        vcp.get_vcp_capabilities()
+
+    with pytest.raises(VCPIOError):
+        with vcp:
+            raise VCPIOError("monitor disconnected")
+    assert vcp.closed == [True]
+    assert vcp._cached_caps is None
+
+    vcp.get_vcp_capabilities()
+    assert vcp.caps_reads == 2
+
+
+def test_nested_vcp_error_keeps_handle(fake_vcp):
+    vcp = fake_vcp()
+    with vcp:
+        vcp.get_vcp_capabilities()
+        with pytest.raises(VCPIOError):
+            with vcp:
+                raise VCPIOError("monitor disconnected")
+        assert vcp.closed == []
+        assert vcp._cached_caps is None
+    assert vcp.closed == []
+
+
+def test_nested_vcp_error_closes_once(fake_vcp):
+    vcp = fake_vcp()
+    with pytest.raises(VCPIOError):
+        with vcp:
+            with vcp:
+                raise VCPIOError("monitor disconnected")
+    assert vcp.closed == [True]
+
+
+def test_other_error_keeps_handle(fake_vcp):
+    vcp = fake_vcp()
+    with pytest.raises(ValueError):
+        with vcp:
+            vcp.get_vcp_capabilities()
+            raise ValueError
+    assert vcp.closed == []
+    assert vcp._cached_caps is not None
+
+
+def test_capabilities_cached(fake_vcp):
+    vcp = fake_vcp()
+    with vcp:
+        caps = vcp.get_vcp_capabilities()
+        assert vcp.get_vcp_capabilities() is caps
+    assert vcp.caps_reads == 1
+
+
+def test_get_code_maximum(fake_vcp):
+    vcp = fake_vcp()
+    luminance = get_vcp_com("image_luminance")
+    with vcp:
+        assert vcp._get_code_maximum(luminance) == 100
+        assert vcp._get_code_maximum(luminance) == 100
+    assert vcp.reads == [luminance]
+    assert vcp.code_maximum[luminance.value] == 100
+
+
+def test_get_code_maximum_outside_context(fake_vcp):
+    with pytest.raises(RuntimeError):
+        fake_vcp()._get_code_maximum(get_vcp_com("image_luminance"))
+
+
+def test_get_code_maximum_write_only(fake_vcp):
+    with fake_vcp() as vcp:
+        with pytest.raises(TypeError):
+            vcp._get_code_maximum(get_vcp_com("image_factory_default"))
+
+
+def test_prefetch_maxima(fake_vcp):
+    codes = [
+        get_vcp_com(name)
+        for name in (
+            "image_factory_default",
+            "image_luminance",
+            "image_contrast",
+            "image_color_preset",
+            "input_select",
+            "display_power_mode",
+        )
+    ]
+    vcp = fake_vcp()
+    with vcp:
+        vcp.prefetch_maxima(codes)
+        vcp.prefetch_maxima(codes)
+    assert [code.name for code in vcp.reads] == [
+        "image_luminance",
+        "image_contrast",
+        "image_color_preset",
+    ]
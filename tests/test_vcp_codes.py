@@ -0,0 +1,166 @@
+import copy
+import dataclasses
+import enum
+import pickle
+
+import pytest
+
+from monitorcontrol.vcp import vcp_codes
+from monitorcontrol.vcp.vcp_codes import (
+    ComType,
+    VPCCommand,
+    add_vcp_com,
+    get_vcp_com,
+    get_vcp_com_by_name,
+    get_vcp_com_by_value,
+    iter_vcp_coms,
+)
+
+
+@pytest.fixture(autouse=True)
+def _restore_registry(monkeypatch):
+    # commands added by a test are dropped afterwards
+    monkeypatch.setattr(vcp_codes, "_BY_NAME", dict(vcp_codes._BY_NAME))
+    monkeypatch.setattr(vcp_codes, "_BY_VALUE", dict(vcp_codes._BY_VALUE))
+
+
+class _Opcode(enum.IntEnum):
+    luminance = 0x10
+
+
+def _command(name: str, value: int, com_type: ComType = ComType.rw) -> VPCCommand:
+    return VPCCommand(
+        name=name,
+        desc=f"{name} description",
+        value=value,
+        type=com_type,
+        discreet=False,
+    )
+
+
+def test_get_vcp_com_by_name():
+    com = get_vcp_com_by_name("image_luminance")
+    assert com.name == "image_luminance"
+    assert com.value == 0x10
+
+
+def test_get_vcp_com_by_value():
+    com = get_vcp_com_by_value(0x10)
+    assert com is get_vcp_com_by_name("image_luminance")
+
+
+@pytest.mark.parametrize("key", ["image_luminance", 0x10, _Opcode.luminance])
+def test_get_vcp_com(key):
+    assert get_vcp_com(key) is get_vcp_com_by_name("image_luminance")
+
+
+def test_get_vcp_com_by_name_missing():
+    with pytest.raises(LookupError):
+        get_vcp_com_by_name("not_a_command")
+
+
+def test_get_vcp_com_by_value_missing():
+    with pytest.raises(LookupError):
+        get_vcp_com_by_value(0xFF)
+
+
+@pytest.mark.parametrize("key", ["not_a_command", 0xFF])
+def test_get_vcp_com_missing(key):
+    with pytest.raises(LookupError):
+        get_vcp_com(key)
+
+
+@pytest.mark.parametrize("key", [1.0, None, b"image_luminance"])
+def test_get_vcp_com_type_error(key):
+    with pytest.raises(TypeError):
+        get_vcp_com(key)
+
+
+def test_add_vcp_com():
+    com = _command("test_add", 0xE0)
+    add_vcp_com(com)
+    assert get_vcp_com("test_add") is com
+    assert get_vcp_com(0xE0) is com
+
+
+def test_add_vcp_com_duplicate_name():
+    with pytest.raises(ValueError):
+        add_vcp_com(_command("image_luminance", 0xE1))
+    with pytest.raises(LookupError):
+        get_vcp_com_by_value(0xE1)
+
+
+def test_add_vcp_com_duplicate_value():
+    with pytest.raises(ValueError):
+        add_vcp_com(_command("test_duplicate_value", 0x10))
+    with pytest.raises(LookupError):
+        get_vcp_com_by_name("test_duplicate_value")
+
+
+@pytest.mark.parametrize("value", [-1, 0x100])
+def test_add_vcp_com_value_range(value):
+    with pytest.raises(ValueError):
+        add_vcp_com(_command("test_value_range", value))
+
+
+def test_iter_vcp_coms():
+    coms = iter_vcp_coms()
+    assert get_vcp_com_by_name("image_luminance") in list(coms)
+
+    com = _command("test_iter", 0xE2)
+    add_vcp_com(com)
+    assert com in list(coms)
+
+
+@pytest.mark.parametrize(
+    "com_type, readable, writeable",
+    [
+        (ComType.ro, True, False),
+        (ComType.wo, False, True),
+        (ComType.rw, True, True),
+    ],
+)
+def test_readable_writeable(com_type, readable, writeable):
+    com = _command("test_type", 0xE3, com_type)
+    assert com.readable is readable
+    assert com.writeable is writeable
+
+
+def test_desc():
+    assert get_vcp_com_by_name("image_luminance").desc == "image luminance"
+
+
+def test_replace():
+    com = get_vcp_com_by_name("image_luminance")
+    replaced = dataclasses.replace(com, value=0xE6, type=ComType.ro)
+    assert replaced.name == com.name
+    assert replaced.desc == com.desc
+    assert replaced.value == 0xE6
+    assert replaced.readable
+    assert not replaced.writeable
+
+
+def _pickle_copy(com: VPCCommand) -> VPCCommand:
+    return pickle.loads(pickle.dumps(com))
+
+
+@pytest.mark.parametrize("copy_fn", [copy.copy, copy.deepcopy, _pickle_copy])
+def test_copy_registered(copy_fn):
+    com = get_vcp_com_by_name("image_luminance")
+    copied = copy_fn(com)
+    assert copied is com
+    assert {com: 1}.get(copied) == 1
+
+
+@pytest.mark.parametrize("copy_fn", [copy.copy, copy.deepcopy, _pickle_copy])
+def test_copy_unregistered(copy_fn):
+    com = _command("test_copy", 0xE7, ComType.ro)
+    copied = copy_fn(com)
+    assert copied is not com
+    assert copied.name == com.name
+    assert copied.desc == com.desc
+    assert copied.value == com.value
+    assert copied.type == com.type
+    assert copied.discreet == com.discreet
+    assert copied.readable == com.readable
+    assert copied.writeable == com.writeable